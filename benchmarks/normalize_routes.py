@@ -0,0 +1,96 @@
+"""
+Benchmark for :func:`flaschenetikett.routeparser.normalize_routes`.
+
+Title/path normalization is compared with computing the same properties one
+route at a time, and decorator merging is compared with normalizing without
+merging, so that each measurement only differs by the work being measured.
+
+Usage: python benchmarks/normalize_routes.py [number of routes]
+"""
+
+import sys
+import time
+
+from flaschenetikett.routeparser import normalize_routes, Route
+
+
+class FakeNode(object):
+    """Stands in for a :class:`compiler.ast.Function` node"""
+    doc = None
+
+    def __init__(self, name):
+        self.name = name
+
+
+def make_corpus(size, handlers=1000, prepaths=20):
+    """
+    Build ``size`` routes from ``handlers`` distinct handlers mounted under
+    ``prepaths`` distinct prepaths, as a large multi-mount app would.  Each
+    handler has its own decorator arguments.
+    """
+    routes = []
+    for i in range(size):
+        handler = i % handlers
+        prepath = (i // handlers) % prepaths
+        rule = '/v{0}/resource{1}/<int:id>/sub/<string:name>'.format(
+            prepath, handler)
+        decorators = [{'name': 'requires_auth',
+                       'args': ['role{0}'.format(handler)],
+                       'kwargs': {'scopes': ['read', 'write']}}]
+        routes.append(Route(rule, ['GET'],
+                            FakeNode('getHTTPResource{0}'.format(handler)),
+                            decorators=decorators))
+    return routes
+
+
+def per_route(routes):
+    for route in routes:
+        route.title
+        route.path
+        route.path_types
+    return routes
+
+
+def merged(routes):
+    return normalize_routes(routes, merge_decorators=True)
+
+
+def parsed(route):
+    return route.handler_name, route.title, route.path, route.path_types
+
+
+def check(sample=2000):
+    """
+    Make sure normalizing gives the same results as parsing each route.
+    """
+    expected = [parsed(route) for route in per_route(make_corpus(sample))]
+    for function in (normalize_routes, merged):
+        results = [parsed(route) for route in function(make_corpus(sample))]
+        if results != expected:
+            raise AssertionError(
+                "{0} does not match per route parsing".format(
+                    function.__name__))
+
+
+def timed(label, function, size):
+    routes = make_corpus(size)
+    start = time.time()
+    function(routes)
+    elapsed = time.time() - start
+    distinct = len(set(id(decorator) for route in routes
+                       for decorator in route.decorators))
+    print '{0:>24}: {1:.3f}s ({2:,.0f} routes/s, {3:,} decorators)'.format(
+        label, elapsed, size / elapsed, distinct)
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    check()
+
+    print 'Titles and paths:'
+    timed('per route', per_route, size)
+    timed('normalized', normalize_routes, size)
+
+    print 'Decorator merging:'
+    timed('normalized, not merged', normalize_routes, size)
+    timed('normalized, merged', merged, size)
@@ -64,6 +64,74 @@ def flatten_name(name_node):
             "Cannot flatten a node of type {0}".format(name_node.__class__))
 
 
+def parse_rule(rule):
+    """
+    Parses a werkzeug rule into a pretty path (instead of
+    ``/<string:name>``, ``/{name}``) and the partial path fragment names
+    paired with their types.
+
+    Only ``int`` and ``string`` types are supported.
+
+    TODO: support other types, support additional type parameters like
+        length for strings, min/max for ints, etc.
+
+    :param rule: the werkzeug rule
+    :type rule: ``str``
+
+    :return: the pretty path and a tuple of ``(name, type)`` pairs
+    :rtype: ``tuple``
+    """
+    path_types = []
+    fragments = rule.split('/')
+
+    for i in range(len(fragments)):
+        if not fragments[i].startswith('<'):
+            continue
+        match = _fragment_finder.search(fragments[i])
+        if match:
+            name_then_type = match.groups()[::-1]
+            path_types.append(name_then_type)
+            fragments[i] = "{{{0}}}".format(name_then_type[0])
+
+    return '/'.join(fragments), tuple(path_types)
+
+
+def _maybe_lower(word):
+    if word.isupper():
+        return word
+    return word.lower()
+
+
+def _maybe_capitalize(word):
+    if word.islower():
+        return word.capitalize()
+    return '{0}{1}'.format(word[0].upper(), word[1:])
+
+
+def title_from_name(name):
+    """
+    Pretty-prints a handler name - the either camel-cased or underscored
+    name is split into words, with the first word capitalized.
+
+    :param name: the handler name
+    :type name: ``str``
+
+    :return: the title
+    :rtype: ``str``
+    """
+    title = name.strip('_')
+
+    # if camel-cased, make it underscored
+    if '_' not in title:
+        for camel_cased in _camel_cased:
+            title = camel_cased.sub(r'\1_\2', title)
+
+    # replace underscores with spaces and capitalize
+    words = title.split('_')
+    return ' '.join([_maybe_capitalize(words[0])] +
+                    [_maybe_lower(word) for word in words[1:]])
+
+
 class Route(object):
     """
     An object that represents a werkzeug route to be documented.
@@ -79,30 +147,32 @@ class Route(object):
         self._path = None
         self._path_types = None
         self._docstring = None
+        self._handler_name = None
         self._title = None
 
-    def _pretty_parse_rule(self):
+    def set_parsed(self, handler_name, title, path, path_types):
         """
-        Parses the werkzeug rule into a pretty path (instead of
-        ``/<string:name>``, ``/{name}``) and a dictionary that maps the
-        partial path fragment names with the type
-
-        Only ``int`` and ``string`` types are supported.
-
-        TODO: support other types, support additional type parameters like
-            length for strings, min/max for ints, etc.
+        Supplies already computed values for :attr:`handler_name`,
+        :attr:`title`, :attr:`path` and :attr:`path_types`, so that they
+        do not have to be parsed again for this route (see
+        :func:`normalize_routes`).
+
+        :param path_types: ``(name, type)`` pairs as produced by
+            :func:`parse_rule`
+        :type path_types: ``tuple``
         """
-        self._path_types = {}
-        fragments = self.rule.split('/')
-
-        for i in range(len(fragments)):
-            match = _fragment_finder.search(fragments[i])
-            if match:
-                name_then_type = match.groups()[::-1]
-                self._path_types.update([name_then_type])
-                fragments[i] = "{{{0}}}".format(name_then_type[0])
+        self._handler_name = handler_name
+        self._title = title
+        self._path = path
+        self._path_types = dict(path_types)
 
-        self._path = '/'.join(fragments)
+    def _pretty_parse_rule(self):
+        """
+        Caches the pretty path and path types produced by
+        :func:`parse_rule`.
+        """
+        self._path, path_types = parse_rule(self.rule)
+        self._path_types = dict(path_types)
 
     @property
     def path(self):
@@ -141,7 +211,9 @@ class Route(object):
         """
         The name of the handler
         """
-        return self._ast_node.name
+        if self._handler_name is None:
+            return self._ast_node.name
+        return self._handler_name
 
     @property
     def title(self):
@@ -151,29 +223,7 @@ class Route(object):
         capitalized.
         """
         if self._title is None:
-            self._title = self._ast_node.name.strip('_')
-
-            # if camel-cased, make it underscored
-            if '_' not in self._title:
-                for camel_cased in _camel_cased:
-                    self._title = camel_cased.sub(r'\1_\2', self._title)
-
-            # replace underscores with spaces and capitalize
-            words = self._title.split('_')
-
-            def _maybe_lower(word):
-                if word.isupper():
-                    return word
-                return word.lower()
-
-            def _maybe_capitalize(word):
-                if word.islower():
-                    return word.capitalize()
-                return '{0}{1}'.format(word[0].upper(), word[1:])
-
-            self._title = ' '.join(
-                [_maybe_capitalize(words[0])] +
-                [_maybe_lower(word) for word in words[1:]])
+            self._title = title_from_name(self.handler_name)
 
         return self._title
 
@@ -381,3 +431,101 @@ def routes_from_module(module_name, prepath=''):
     walk(tree, route_visitor, walker=route_visitor)
 
     return routes
+
+
+def _intern(string):
+    """
+    Intern byte strings so that repeated rules and handler names share one
+    object - ``intern`` does not accept unicode strings.
+    """
+    if type(string) is str:
+        return intern(string)
+    return string
+
+
+_hashable_scalars = frozenset([str, unicode, int, long, float, bool,
+                               type(None)])
+
+
+def _freeze(value):
+    """
+    Turn a (possibly nested) decorator value into a hashable key.  Each value
+    is paired with its type so that values which compare equal but differ in
+    type (such as ``1``, ``1.0`` and ``True``) produce different keys.
+
+    :raises TypeError: if the value cannot be made hashable
+    """
+    value_type = type(value)
+    if value_type in _hashable_scalars:
+        return value_type, value
+    elif isinstance(value, (list, tuple)):
+        return value_type, tuple([_freeze(item) for item in value])
+    elif isinstance(value, dict):
+        return value_type, frozenset([(_freeze(key), _freeze(item))
+                                      for key, item in value.iteritems()])
+    hash(value)
+    return value_type, value
+
+
+def _decorator_key(decorator):
+    """
+    A hashable key for a decorator produced by
+    :meth:`RouteFindingASTVisitor.flattenDecorator`, or ``None`` if it has
+    no arguments or its arguments cannot be made hashable.
+    """
+    args, kwargs = decorator['args'], decorator['kwargs']
+    if not args and not kwargs:
+        return decorator['name']
+    try:
+        return decorator['name'], _freeze(args), _freeze(kwargs)
+    except TypeError:
+        return None
+
+
+def normalize_routes(routes, merge_decorators=False):
+    """
+    Computes the handler names, titles, paths and path types of a whole list
+    of routes at once, so that routes sharing a handler name or a rule (for
+    instance the same handlers mounted under several prepaths) are only
+    parsed once.  Rules and handler names are interned.
+
+    If ``merge_decorators`` is set, decorator dictionaries that are
+    identical across routes (including the types of their values) are also
+    replaced by a single shared dictionary, to save memory on very large
+    route lists.  Those shared dictionaries (and their ``args`` and
+    ``kwargs``) must then not be mutated.
+
+    :param routes: the routes to normalize
+    :type routes: ``iterable`` of :class:`Route`
+
+    :param merge_decorators: whether to merge identical decorators
+    :type merge_decorators: ``bool``
+
+    :return: the same routes, normalized
+    :rtype: ``list`` of :class:`Route`
+    """
+    routes = list(routes)
+    titles = {}
+    rules = {}
+    decorators = {}
+
+    for route in routes:
+        route.rule = _intern(route.rule)
+        name = _intern(route.handler_name)
+
+        if name not in titles:
+            titles[name] = title_from_name(name)
+        if route.rule not in rules:
+            rules[route.rule] = parse_rule(route.rule)
+        path, path_types = rules[route.rule]
+        route.set_parsed(name, titles[name], path, path_types)
+
+        if not merge_decorators:
+            continue
+
+        for i, decorator in enumerate(route.decorators):
+            key = _decorator_key(decorator)
+            if key is not None:
+                route.decorators[i] = decorators.setdefault(key, decorator)
+
+    return routes
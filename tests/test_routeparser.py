@@ -6,7 +6,8 @@ from compiler import ast
 import mock
 from unittest import TestCase
 
-from flaschenetikett.routeparser import flatten_name, Route
+from flaschenetikett.routeparser import (
+    flatten_name, normalize_routes, Route)
 
 
 class RouteTestCase(TestCase):
@@ -95,6 +96,115 @@ class RouteTestCase(TestCase):
             r = Route('/', ['GET'], self.ast_node)
             self.assertEqual(r.title, expected)
 
+    def test_set_parsed(self):
+        """
+        Values supplied by :meth:`Route.set_parsed` are used instead of
+        parsing the handler name and rule
+        """
+        self.ast_node.name = 'original'
+        r = Route('/<int:id>', ['GET'], self.ast_node)
+        r.set_parsed('handler', 'A title', '/{ident}', (('ident', 'int'),))
+        self.assertEqual(r.handler_name, 'handler')
+        self.assertEqual(r.title, 'A title')
+        self.assertEqual(r.path, '/{ident}')
+        self.assertEqual(r.path_types, {'ident': 'int'})
+        self.assertEqual(self.ast_node.name, 'original')
+
+
+class NormalizeRoutesTestCase(TestCase):
+    """
+    Tests for :mod:`flaschenetikett.routeparser.normalize_routes`
+    """
+    def make_route(self, rule, name, decorators=None):
+        ast_node = mock.MagicMock(spec=['doc', 'name'])
+        ast_node.name = name
+        return Route(rule, ['GET'], ast_node, decorators=decorators)
+
+    def test_same_results_as_unnormalized(self):
+        """
+        Normalized routes have the same titles, paths and path types as
+        routes that compute them one at a time
+        """
+        args = [('/a/<int:id>', 'getHTTPThing'),
+                ('/b/<int:id>', 'getHTTPThing'),
+                ('/a/<int:id>', 'other_thing')]
+        normalized = normalize_routes(
+            self.make_route(*arg) for arg in args)
+        for arg, route in zip(args, normalized):
+            expected = self.make_route(*arg)
+            self.assertEqual(route.handler_name, expected.handler_name)
+            self.assertEqual(route.title, expected.title)
+            self.assertEqual(route.path, expected.path)
+            self.assertEqual(route.path_types, expected.path_types)
+
+    def test_shares_results_across_identical_inputs(self):
+        """
+        Routes with the same handler name share a title, and routes with the
+        same rule share a path but each get their own path types dictionary
+        """
+        routes = normalize_routes([self.make_route('/<int:id>', 'handler'),
+                                   self.make_route('/<int:id>', 'handler')])
+        self.assertIs(routes[0].title, routes[1].title)
+        self.assertIs(routes[0].path, routes[1].path)
+        self.assertIsNot(routes[0].path_types, routes[1].path_types)
+
+    def test_reuses_identical_decorators(self):
+        """
+        Equal decorator dictionaries are replaced by a single dictionary,
+        while differing ones are left alone
+        """
+        def decorator(arg):
+            return {'name': 'auth', 'args': [arg], 'kwargs': {}}
+
+        routes = normalize_routes([
+            self.make_route('/a', 'a', [decorator('admin')]),
+            self.make_route('/b', 'b', [decorator('admin')]),
+            self.make_route('/c', 'c', [decorator('user')])],
+            merge_decorators=True)
+        self.assertIs(routes[0].decorators[0], routes[1].decorators[0])
+        self.assertIsNot(routes[0].decorators[0], routes[2].decorators[0])
+        self.assertEqual(routes[2].decorators[0], decorator('user'))
+
+    def test_does_not_merge_equal_decorators_of_different_types(self):
+        """
+        Decorators whose arguments compare equal but have different types,
+        such as ``1`` and ``True``, are not merged
+        """
+        routes = normalize_routes([
+            self.make_route('/a', 'a',
+                            [{'name': 'auth', 'args': [1], 'kwargs': {}}]),
+            self.make_route('/b', 'b',
+                            [{'name': 'auth', 'args': [True], 'kwargs': {}}])],
+            merge_decorators=True)
+        self.assertIsNot(routes[0].decorators[0], routes[1].decorators[0])
+        self.assertIs(routes[1].decorators[0]['args'][0], True)
+
+    def test_leaves_unhashable_decorators_alone(self):
+        """
+        Decorators containing values that cannot be hashed are kept as they
+        are rather than merged
+        """
+        def decorator():
+            return {'name': 'auth', 'args': [set([1])], 'kwargs': {}}
+
+        routes = normalize_routes([self.make_route('/a', 'a', [decorator()]),
+                                   self.make_route('/b', 'b', [decorator()])],
+                                  merge_decorators=True)
+        self.assertIsNot(routes[0].decorators[0], routes[1].decorators[0])
+        self.assertEqual(routes[0].decorators[0], decorator())
+
+    def test_does_not_merge_decorators_by_default(self):
+        """
+        Unless asked to, identical decorators are not merged, so each route
+        keeps its own decorator dictionaries
+        """
+        def decorator():
+            return {'name': 'auth', 'args': ['admin'], 'kwargs': {}}
+
+        routes = normalize_routes([self.make_route('/a', 'a', [decorator()]),
+                                   self.make_route('/b', 'b', [decorator()])])
+        self.assertIsNot(routes[0].decorators[0], routes[1].decorators[0])
+
 
 class FlattenNameTestCase(TestCase):
     """